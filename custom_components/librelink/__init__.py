@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_URL, CONF_USERNAME, Platform
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_URL,
+    CONF_USERNAME,
+    Platform,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import LibreLinkAPI
-from .const import CONF_PATIENT_ID, DOMAIN, LOGGER
+from .const import CONF_PATIENT_ID, DOMAIN, LOGGER, REFRESH_RATE_MIN
 from .coordinator import LibreLinkDataUpdateCoordinator
 
-# Better trend calculation
-from .trend_calculator import TrendCalculator
 PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
 
@@ -43,12 +49,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await api.async_login(username=username, password=password)
 
         coordinator = LibreLinkDataUpdateCoordinator(
-            hass=hass, api=api, patient_id=patient_id
+            hass=hass,
+            api=api,
+            patient_id=patient_id,
+            update_interval=_get_update_interval(hass, username),
         )
 
-        # Attach the calculator to the coordinator
-        coordinator.trend_calculator = TrendCalculator()  
-        
         # First poll of the data to be ready for entities initialization
         await coordinator.async_config_entry_first_refresh()
 
@@ -56,6 +62,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         coordinator: LibreLinkDataUpdateCoordinator = domain_data[username]
         coordinator.register_patient(patient_id)
+        coordinator.update_interval = _get_update_interval(hass, username)
+
+    # Apply a new refresh rate when the options are changed
+    entry.async_on_unload(entry.add_update_listener(async_update_listener))
 
     # Then launch async_setup_entry for our declared entities in sensor.py and binary_sensor.py
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -63,11 +73,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle options update."""
+    username = entry.data[CONF_USERNAME]
+    coordinator: LibreLinkDataUpdateCoordinator = hass.data[DOMAIN][username]
+    coordinator.update_interval = _get_update_interval(hass, username)
+
+
+def _get_update_interval(
+    hass: HomeAssistant, username: str, exclude_entry_id: str | None = None
+) -> timedelta:
+    """Return the shortest refresh rate configured for an account.
+
+    All entries (patients) of an account share one coordinator, so the
+    shortest rate of its enabled entries is used, whatever order they load in.
+    """
+    rates = [
+        entry.options.get(CONF_SCAN_INTERVAL, REFRESH_RATE_MIN)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.data[CONF_USERNAME] == username
+        and entry.disabled_by is None
+        and entry.entry_id != exclude_entry_id
+    ]
+    return timedelta(minutes=min(rates, default=REFRESH_RATE_MIN))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator: LibreLinkDataUpdateCoordinator = hass.data[DOMAIN][CONF_USERNAME]
+        username = entry.data[CONF_USERNAME]
+        coordinator: LibreLinkDataUpdateCoordinator = hass.data[DOMAIN][username]
         coordinator.unregister_patient(entry.data[CONF_PATIENT_ID])
         if coordinator.tracked_patients == 0:
-            hass.data[DOMAIN].pop(CONF_USERNAME)
+            hass.data[DOMAIN].pop(username)
+        else:
+            # The removed entry's refresh rate no longer applies
+            coordinator.update_interval = _get_update_interval(
+                hass, username, entry.entry_id
+            )
     return unloaded
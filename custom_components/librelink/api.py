@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 import socket
+from typing import Any
 
 import aiohttp
 
@@ -59,6 +60,9 @@ class Patient:
     measurement: Measurement
     target: Target
     device: LibreLinkDevice
+    # Trend and deltas, filled in by the coordinator for tracked patients
+    trend_info: dict[str, Any] | None = None
+    deltas: dict[int, dict[str, Any]] = field(default_factory=dict)
 
     @property
     def name(self):
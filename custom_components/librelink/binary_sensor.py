@@ -48,10 +48,7 @@ class LibreLinkBinarySensor(LibreLinkSensorBase, BinarySensorEntity):
 class HighSensor(LibreLinkBinarySensor):
     """High Sensor class."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of the binary_sensor."""
-        return "Is High"
+    _attr_name = "Is High"
 
     @property
     def is_on(self) -> bool:
@@ -62,10 +59,7 @@ class HighSensor(LibreLinkBinarySensor):
 class LowSensor(LibreLinkBinarySensor):
     """Low Sensor class."""
 
-    @property
-    def name(self) -> str:
-        """Return the name of the binary_sensor."""
-        return "Is Low"
+    _attr_name = "Is Low"
 
     @property
     def is_on(self) -> bool:
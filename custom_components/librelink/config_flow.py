@@ -7,12 +7,17 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import (
     CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_URL,
     CONF_USERNAME,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
@@ -28,7 +33,7 @@ from .api import (
     LibreLinkAPIConnectionError,
     LibreLinkAPIError,
 )
-from .const import BASE_URL_LIST, CONF_PATIENT_ID, DOMAIN, LOGGER
+from .const import BASE_URL_LIST, CONF_PATIENT_ID, DOMAIN, LOGGER, REFRESH_RATE_MIN
 from .units import UNITS_OF_MEASUREMENT
 
 
@@ -37,6 +42,14 @@ class LibreLinkFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> LibreLinkOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return LibreLinkOptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -135,3 +148,44 @@ class LibreLinkFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 }
             ),
         )
+
+
+class LibreLinkOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for LibreLink."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.FlowResult:
+        """Manage the refresh rate."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title="",
+                data={CONF_SCAN_INTERVAL: int(user_input[CONF_SCAN_INTERVAL])},
+            )
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SCAN_INTERVAL,
+                        default=self._config_entry.options.get(
+                            CONF_SCAN_INTERVAL, REFRESH_RATE_MIN
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=60,
+                            step=1,
+                            unit_of_measurement="min",
+                            mode=NumberSelectorMode.BOX,
+                        ),
+                    ),
+                }
+            ),
+        )
@@ -41,6 +41,8 @@ GLUCOSE_TREND_MESSAGE: Final = {
     4: "Increasing",
     5: "Increasing fast",
 }
+# mg/dL to mmol/L conversion factor used for rates and deltas
+MMOL_PER_MGDL: Final = 0.0555
 
 
 CONF_PATIENT_ID: Final = "patient_id"
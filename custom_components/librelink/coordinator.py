@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+import logging
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -19,28 +20,38 @@ class LibreLinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Patient]]):
         hass: HomeAssistant,
         api: LibreLinkAPI,
         patient_id: str,
+        update_interval: timedelta = timedelta(minutes=REFRESH_RATE_MIN),
     ) -> None:
         """Initialize."""
         self.api: LibreLinkAPI = api
         self._tracked_patients: set[str] = {patient_id}
-        
-        # Initialize the trend calculator
-        self.trend_calculator = TrendCalculator(max_history=60)  # Store up to 60 measurements
 
+        # One trend calculator per tracked patient, each keeping the default
+        # 30 measurements
+        self.trend_calculators: dict[str, TrendCalculator] = {
+            patient_id: TrendCalculator()
+        }
+
+        # LibreLinkUp has no push or streaming endpoint, so the data is polled.
+        # Listeners are still notified when a poll returns unchanged data: the
+        # trend sensors rely on these refreshes to report stale readings.
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=REFRESH_RATE_MIN),
+            update_interval=update_interval,
         )
 
     def register_patient(self, patient_id: str) -> None:
         """Register a new patient to track."""
         self._tracked_patients.add(patient_id)
+        if patient_id not in self.trend_calculators:
+            self.trend_calculators[patient_id] = TrendCalculator()
 
     def unregister_patient(self, patient_id: str) -> None:
         """Unregister a patient to track."""
-        self._tracked_patients.remove(patient_id)
+        self._tracked_patients.discard(patient_id)
+        self.trend_calculators.pop(patient_id, None)
 
     @property
     def tracked_patients(self) -> int:
@@ -52,30 +63,47 @@ class LibreLinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Patient]]):
         # Get the list of patients from API
         patients_list = await self.api.async_get_data()
         
-        # Convert to dictionary for return
-        patients_dict = {patient.id: patient for patient in patients_list}
-        
-        # Feed measurements to trend calculator
-        if hasattr(self, 'trend_calculator') and self.trend_calculator:
-            for patient in patients_list:
-                if patient.id in self._tracked_patients:
-                    if patient.measurement and patient.measurement.value:
-                        # Convert timestamp to string if it's a datetime object
-                        timestamp = patient.measurement.timestamp
-                        if hasattr(timestamp, 'isoformat'):
-                            timestamp_str = timestamp.isoformat()
-                        else:
-                            timestamp_str = str(timestamp)
-                        
-                        measurement_dict = {
-                            "Timestamp": timestamp_str,
-                            "Value": patient.measurement.value,
-                            "TrendArrow": patient.measurement.trend
-                        }
-                        self.trend_calculator.add_measurement(measurement_dict)
-                        LOGGER.debug(
-                            "Added measurement for patient %s to trend calculator. Value: %s mg/dL, Time: %s",
-                            patient.id, patient.measurement.value, timestamp_str
-                        )
-        
-        return patients_dict
\ No newline at end of file
+        patients_dict: dict[str, Patient] = {
+            patient.id: patient for patient in patients_list
+        }
+
+        # Tracked patients present in this response (also a snapshot of the
+        # tracked set for this update). Usually one patient out of the account.
+        relevant_ids = patients_dict.keys() & self._tracked_patients
+        if not relevant_ids:
+            return patients_dict
+
+        trend_calculators = self.trend_calculators
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+
+        # Feed new measurements to each patient's trend calculator, then
+        # calculate trend and deltas once for all sensors of the patient
+        for patient_id in relevant_ids:
+            patient = patients_dict[patient_id]
+            trend_calculator = trend_calculators[patient_id]
+            measurement = patient.measurement
+            if measurement and measurement.value:
+                # The trend calculator works on POSIX epoch seconds, the API
+                # always parses the measurement timestamp into a datetime
+                ts_epoch = measurement.timestamp.timestamp()
+
+                # Readings the calculator already has are skipped
+                value = measurement.value
+                if trend_calculator.add_measurement(ts_epoch, value, measurement.trend) and debug:
+                    LOGGER.debug(
+                        "Added measurement for patient %s to trend calculator. Value: %s mg/dL, Time: %s",
+                        patient_id, value, measurement.timestamp
+                    )
+
+            patient.trend_info = trend_calculator.calculate_trend()
+            patient.deltas = {
+                1: trend_calculator.calculate_delta_1min(),
+                5: trend_calculator.calculate_delta_5min(),
+                15: trend_calculator.calculate_delta_15min(),
+            }
+            if debug:
+                LOGGER.debug(
+                    "Calculated trend info for patient %s: %s", patient_id, patient.trend_info
+                )
+
+        return patients_dict
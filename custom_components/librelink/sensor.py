@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Final
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -9,7 +11,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_UNIT_OF_MEASUREMENT, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -22,6 +24,7 @@ from .const import (
     GLUCOSE_TREND_ICON,
     GLUCOSE_TREND_MESSAGE,
     GLUCOSE_VALUE_ICON,
+    MMOL_PER_MGDL,
     NAME,
     VERSION,
 )
@@ -32,6 +35,56 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNITS_BY_NAME = {u.unit_of_measurement: u for u in UNITS_OF_MEASUREMENT}
+
+# Fallbacks when no trend could be determined
+_ARROW_UNKNOWN: Final = "→"
+_ICON_UNKNOWN: Final = "mdi:help-circle-outline"
+
+# Map the trend calculator categories to Material Design Icons
+# This matches what trend_calculator._trend_to_arrow() returns
+_TREND_ICON: Final = {
+    "FALLING_FAST": "mdi:arrow-down-bold",      # ↓
+    "FALLING": "mdi:arrow-bottom-right",        # ↘
+    "STABLE": "mdi:arrow-right",                # →
+    "RISING": "mdi:arrow-top-right",            # ↗
+    "RISING_FAST": "mdi:arrow-up-bold",         # ↑
+    "STALE_DATA": "mdi:clock-alert-outline",    # Clock with alert for stale data
+    "UNKNOWN": "mdi:help-circle-outline",       # Question mark for unknown
+}
+
+# Readable trend, from a calculator category or a server trend arrow
+_TREND_STRING: Final = {
+    "FALLING_FAST": "Falling fast",
+    "FALLING": "Falling",
+    "STABLE": "Stable",
+    "RISING": "Rising",
+    "RISING_FAST": "Rising fast",
+}
+_TREND_INT_STRING: Final = {
+    1: "Falling fast",
+    2: "Falling",
+    3: "Stable",
+    4: "Rising",
+    5: "Rising fast",
+}
+
+# Arrow character, from a server trend arrow or a calculator category
+_ARROW_INT: Final = {
+    1: "↓",   # Falling fast
+    2: "↘",   # Falling
+    3: "→",   # Stable
+    4: "↗",   # Rising
+    5: "↑",   # Rising fast
+}
+_ARROW_STR: Final = {
+    "FALLING_FAST": "↓",
+    "FALLING": "↘",
+    "STABLE": "→",
+    "RISING": "↗",
+    "RISING_FAST": "↑",
+}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -41,9 +94,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.data[CONF_USERNAME]]
 
     # If custom unit of measurement is selectid it is initialized, otherwise MG/DL is used
-    unit = {u.unit_of_measurement: u for u in UNITS_OF_MEASUREMENT}.get(
-        config_entry.data[CONF_UNIT_OF_MEASUREMENT]
-    )
+    unit = _UNITS_BY_NAME.get(config_entry.data[CONF_UNIT_OF_MEASUREMENT])
     pid = config_entry.data[CONF_PATIENT_ID]
 
     # For each patients, new Device base on patients and
@@ -69,11 +120,24 @@ async def async_setup_entry(
 class LibreLinkSensorBase(CoordinatorEntity[LibreLinkDataUpdateCoordinator]):
     """LibreLink Sensor base class."""
 
+    # Only our own instance attributes, the Home Assistant base classes keep
+    # their __dict__ (and manage the _attr_* attributes themselves)
+    __slots__ = ("id", "_data")
+
     def __init__(self, coordinator: LibreLinkDataUpdateCoordinator, pid: str) -> None:
         """Initialize the device class."""
         super().__init__(coordinator)
 
         self.id = pid
+        self._attr_unique_id = f"{pid} {self._attr_name}".replace(" ", "_").lower()
+        # Patient data of this sensor, refreshed on each coordinator update
+        self._data = coordinator.data[pid]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._data = self.coordinator.data[self.id]
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self):
@@ -95,20 +159,6 @@ class LibreLinkSensorBase(CoordinatorEntity[LibreLinkDataUpdateCoordinator]):
         """Return if the entity has a name."""
         return True
 
-    @property
-    def _data(self):
-        return self.coordinator.data[self.id]
-
-    @property
-    def unique_id(self):
-        """Return the unique id of the sensor."""
-        return f"{self._data.id} {self.name}".replace(" ", "_").lower()
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        return {}
-
 
 class LibreLinkSensor(LibreLinkSensorBase, SensorEntity):
     """LibreLink Sensor class."""
@@ -122,54 +172,22 @@ class LibreLinkSensor(LibreLinkSensorBase, SensorEntity):
 class TrendSensor(LibreLinkSensor):
     """Trend sensor."""
 
+    _attr_name = "Trend"
+
     def __init__(self, coordinator, patient_id):
         """Initialize the sensor."""
         super().__init__(coordinator, patient_id)
         self._attr_icon = "mdi:trending-up"
-        self._calculated_trend = None
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Trend"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        try:
-            if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-                
-                if self._data.measurement and self._data.measurement.value:
-                    # Convert timestamp to string for trend calculator
-                    timestamp = self._data.measurement.timestamp
-                    if hasattr(timestamp, 'isoformat'):
-                        timestamp_str = timestamp.isoformat()
-                    else:
-                        timestamp_str = str(timestamp)
-                    
-                    measurement_data = {
-                        "Timestamp": timestamp_str,
-                        "Value": self._data.measurement.value,
-                        "TrendArrow": self._data.measurement.trend
-                    }
-                    
-                    self.coordinator.trend_calculator.add_measurement(measurement_data)
-                    trend_info = self.coordinator.trend_calculator.calculate_trend()
-                    self._calculated_trend = trend_info
-                    
-                    _LOGGER.debug("Calculated trend info: %s", trend_info)
-                    
-                    if trend_info.get("calculated", False):
-                        result = trend_info["description"]
-                        return result
-                    else:
-                        # Even if not calculated, the calculator might have a fallback
-                        result = trend_info.get("description", "Unknown")
-                        return result
-        except Exception as e:
-            _LOGGER.error("Enhanced trend calculation failed: %s", e, exc_info=True)
-            # Fall through to server trend
-        
+        # Trend is calculated once per update by the coordinator
+        trend_info = self._data.trend_info
+        if trend_info is not None:
+            if self._data.measurement and self._data.measurement.value:
+                return trend_info.get("description", "Unknown")
+
         # FALLBACK: Use server trend only if enhanced calculation failed
         if measurement := self._data.measurement:
             if trend := measurement.trend:
@@ -182,46 +200,30 @@ class TrendSensor(LibreLinkSensor):
     def icon(self):
         """Return the icon for the frontend based on enhanced trend calculation."""
         # Use trend calculator data for icon, not the original trend icon
-        if self._calculated_trend:
-            trend_category = self._calculated_trend.get("trend", "UNKNOWN").upper()
-            
-            # Map the trend calculator categories to Material Design Icons
-            # This matches what trend_calculator._trend_to_arrow() returns
-            icon_mapping = {
-                "FALLING_FAST": "mdi:arrow-down-bold",      # ↓
-                "FALLING": "mdi:arrow-bottom-right",        # ↘
-                "STABLE": "mdi:arrow-right",                # →
-                "RISING": "mdi:arrow-top-right",            # ↗
-                "RISING_FAST": "mdi:arrow-up-bold",         # ↑
-                "STALE_DATA": "mdi:clock-alert-outline",    # Clock with alert for stale data
-                "UNKNOWN": "mdi:help-circle-outline",       # Question mark for unknown
-            }
-            
-            return icon_mapping.get(trend_category, "mdi:help-circle-outline")
+        if trend_info := self._data.trend_info:
+            trend_category = trend_info.get("trend", "UNKNOWN").upper()
+            return _TREND_ICON.get(trend_category, _ICON_UNKNOWN)
         
         # Fallback if calculation hasn't run yet
-        return "mdi:help-circle-outline"
+        return _ICON_UNKNOWN
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        # Start with parent attributes
-        attrs = super().extra_state_attributes
-        
         # Add enhanced info if available
-        if self._calculated_trend:
-            attrs.update({
-                "trend_calculated": self._calculated_trend.get("calculated", False),
-                "trend_rate_mgdl_per_min": round(self._calculated_trend.get("rate", 0.0), 4),
-                "trend_rate_mmoll_per_min": round(self._calculated_trend.get("rate", 0.0) * 0.0555, 4),
-                "trend_arrow": self._calculated_trend.get("arrow", "→"),
-                "trend_category": self._calculated_trend.get("trend", "UNKNOWN"),
-                "history_count": self._calculated_trend.get("history_count", 0),
-                "data_is_fresh": self._calculated_trend.get("data_is_fresh", False),
-                "minutes_since_last": round(self._calculated_trend.get("minutes_since_last", 999), 1)
-            })
+        if trend_info := self._data.trend_info:
+            return {
+                "trend_calculated": trend_info.get("calculated", False),
+                "trend_rate_mgdl_per_min": round(trend_info.get("rate", 0.0), 4),
+                "trend_rate_mmoll_per_min": round(trend_info.get("rate", 0.0) * MMOL_PER_MGDL, 4),
+                "trend_arrow": trend_info.get("arrow", _ARROW_UNKNOWN),
+                "trend_category": trend_info.get("trend", "UNKNOWN"),
+                "history_count": trend_info.get("history_count", 0),
+                "data_is_fresh": trend_info.get("data_is_fresh", False),
+                "minutes_since_last": round(trend_info.get("minutes_since_last", 999), 1)
+            }
         
-        return attrs
+        return {}
 
     def _convert_trend(self, trend):
         """Convert the trend value to a readable string."""
@@ -230,25 +232,11 @@ class TrendSensor(LibreLinkSensor):
         
         # If it's already a string from our calculator
         if isinstance(trend, str):
-            trend_map = {
-                "FALLING_FAST": "Falling fast",
-                "FALLING": "Falling",
-                "STABLE": "Stable",
-                "RISING": "Rising",
-                "RISING_FAST": "Rising fast",
-            }
-            return trend_map.get(str(trend).upper(), "Unknown")
+            return _TREND_STRING.get(trend.upper(), "Unknown")
         
         # If it's an integer from the server
         if isinstance(trend, int):
-            trend_map = {
-                1: "Falling fast",
-                2: "Falling",
-                3: "Stable",
-                4: "Rising", 
-                5: "Rising fast"
-            }
-            return trend_map.get(trend, "Unknown")
+            return _TREND_INT_STRING.get(trend, "Unknown")
         
         return "Unknown"
 
@@ -256,31 +244,30 @@ class TrendSensor(LibreLinkSensor):
 class RateOfChangeSensor(LibreLinkSensor):
     """Rate of Change."""
 
+    __slots__ = ("unit", "_is_mmol", "_display_scale", "_unit_label")
+
+    _attr_name = "Rate of Change"
+
     def __init__(self, coordinator, patient_id, unit):
         """Initialize the sensor."""
         super().__init__(coordinator, patient_id)
         self._attr_icon = "mdi:speedometer"
         self.unit = unit  # Store the selected unit
-        self._calculated_trend = None
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Rate of Change"
+        # Rates and deltas are calculated in mg/dL, scale them once for display
+        self._is_mmol = unit.unit_of_measurement == "mmol/L"
+        self._display_scale = MMOL_PER_MGDL if self._is_mmol else 1.0
+        self._unit_label = "mmol/L per min" if self._is_mmol else "mg/dL per min"
 
     @property
     def native_unit_of_measurement(self):
         """Return the unit of measurement based on selected unit."""
-        if self.unit.unit_of_measurement == "mmol/L":
-            return "mmol/L per min"
-        return "mg/dL per min"
+        return self._unit_label
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-            trend_info = self.coordinator.trend_calculator.calculate_trend()
-            self._calculated_trend = trend_info
+        trend_info = self._data.trend_info
+        if trend_info is not None:
             rate = trend_info.get("rate", 0.0)
             
             # Check for the special "stale data" trend
@@ -289,43 +276,31 @@ class RateOfChangeSensor(LibreLinkSensor):
                 return None
             
             # Convert rate based on selected unit
-            if self.unit.unit_of_measurement == "mmol/L":
-                converted_rate = rate * 0.0555
-                return round(converted_rate, 2)
-            
-            return round(rate, 2)
+            return round(rate * self._display_scale, 2)
         
         return None
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        # Start with parent attributes
-        attrs = super().extra_state_attributes
-        
         # Only add trend info if we have calculated trend data
-        if self._calculated_trend is not None:
-            attrs.update({
-                "trend_category": self._calculated_trend.get("trend"),
-                "trend_description": self._calculated_trend.get("description"),
-                "trend_arrow": self._calculated_trend.get("arrow"),
-                "history_count": self._calculated_trend.get("history_count")
-            })
+        if (trend_info := self._data.trend_info) is not None:
+            return {
+                "trend_category": trend_info.get("trend"),
+                "trend_description": trend_info.get("description"),
+                "trend_arrow": trend_info.get("arrow"),
+                "history_count": trend_info.get("history_count")
+            }
         
-        return attrs
+        return {}
 
 # Delta for 1min, 5min, 15min
 class Delta1MinSensor(RateOfChangeSensor):
     """1-minute Delta sensor."""
 
-    def __init__(self, coordinator, patient_id, unit):
-        """Initialize the sensor."""
-        super().__init__(coordinator, patient_id, unit)
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Delta 1min"
+    _attr_name = "Delta 1min"
+    # Time window of the delta, subclasses only need to change this
+    _delta_minutes = 1
 
     @property
     def native_unit_of_measurement(self):
@@ -335,278 +310,118 @@ class Delta1MinSensor(RateOfChangeSensor):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
+        trend_info = self._data.trend_info
+        if trend_info is not None:
             # 1. Check the main trend result for stale data
-            trend_info = self.coordinator.trend_calculator.calculate_trend()
             if trend_info.get("trend") == "STALE_DATA":
                 return None
             
             # 2. Get the specific delta result
-            delta_result = self.coordinator.trend_calculator.calculate_delta_1min()
+            delta_result = self._data.deltas[self._delta_minutes]
             
-            # 3. Check if a suitable measurement was actually found for the 1-min window
+            # 3. Check if a suitable measurement was actually found for the window
             if not delta_result.get("found", False):
                 return None
             
             delta_mgdl = delta_result.get("delta_value", 0.0)
             
             # Convert to selected unit
-            if self.unit.unit_of_measurement == "mmol/L":
-                delta = delta_mgdl * 0.0555
-            else:
-                delta = delta_mgdl
-            
-            return round(delta, 2)
+            return round(delta_mgdl * self._display_scale, 2)
         
         return None
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        # Start with parent attributes
-        attrs = super().extra_state_attributes
-        
-        if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-            result = self.coordinator.trend_calculator.calculate_delta_1min()
-            attrs.update({
+        if result := self._data.deltas.get(self._delta_minutes):
+            return {
                 "delta_raw_mgdl": round(result.get("delta_value", 0.0), 2),
                 "time_window_min": round(result.get("time_diff", 0.0), 2),
                 "measurement_found": result.get("found", False),
                 "note": result.get("note", "")
-            })
+            }
         
-        return attrs
+        return {}
 
 class Delta5MinSensor(Delta1MinSensor):
     """5-minute Delta sensor."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Delta 5min"
-    
-    @property
-    def native_unit_of_measurement(self):
-        return self.unit.unit_of_measurement  
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-            # 1. Check the main trend result for stale data
-            trend_info = self.coordinator.trend_calculator.calculate_trend()
-            if trend_info.get("trend") == "STALE_DATA":
-                return None
-            
-            # 2. Get the specific delta result
-            delta_result = self.coordinator.trend_calculator.calculate_delta_5min()
-            
-            # 3. Check if a suitable measurement was actually found for the 5-min window
-            if not delta_result.get("found", False):
-                return None
-            
-            delta_mgdl = delta_result.get("delta_value", 0.0)
-            
-            # Convert to selected unit
-            if self.unit.unit_of_measurement == "mmol/L":
-                delta = delta_mgdl * 0.0555
-            else:
-                delta = delta_mgdl
-            
-            return round(delta, 2)
-        
-        return None
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        # Start with parent attributes
-        attrs = super().extra_state_attributes
-        
-        if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-            result = self.coordinator.trend_calculator.calculate_delta_5min()
-            attrs.update({
-                "delta_raw_mgdl": round(result.get("delta_value", 0.0), 2),
-                "time_window_min": round(result.get("time_diff", 0.0), 2),
-                "measurement_found": result.get("found", False),
-                "note": result.get("note", "")
-            })
-        
-        return attrs
+    _attr_name = "Delta 5min"
+    _delta_minutes = 5
 
 class Delta15MinSensor(Delta1MinSensor):
     """15-minute Delta sensor."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Delta 15min"
-
-    @property
-    def native_unit_of_measurement(self):
-        return self.unit.unit_of_measurement  
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-            # 1. Check the main trend result for stale data
-            trend_info = self.coordinator.trend_calculator.calculate_trend()
-            if trend_info.get("trend") == "STALE_DATA":
-                return None
-            
-            # 2. Get the specific delta result
-            delta_result = self.coordinator.trend_calculator.calculate_delta_15min()
-            
-            # 3. Check if a suitable measurement was actually found for the 15-min window
-            if not delta_result.get("found", False):
-                return None
-            
-            delta_mgdl = delta_result.get("delta_value", 0.0)
-            
-            # Convert to selected unit
-            if self.unit.unit_of_measurement == "mmol/L":
-                delta = delta_mgdl * 0.0555
-            else:
-                delta = delta_mgdl
-            
-            return round(delta, 2)
-        
-        return None
-
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        # Start with parent attributes
-        attrs = super().extra_state_attributes
-        
-        if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-            result = self.coordinator.trend_calculator.calculate_delta_15min()
-            attrs.update({
-                "delta_raw_mgdl": round(result.get("delta_value", 0.0), 2),
-                "time_window_min": round(result.get("time_diff", 0.0), 2),
-                "measurement_found": result.get("found", False),
-                "note": result.get("note", "")
-            })
-        
-        return attrs
+    _attr_name = "Delta 15min"
+    _delta_minutes = 15
 
 # Trend Arrow sensor
 class TrendArrowSensor(LibreLinkSensor):
     """Trend Arrow sensor."""
 
+    _attr_name = "Glucose Trend Arrow"
+
     def __init__(self, coordinator, patient_id):
         """Initialize the sensor."""
         super().__init__(coordinator, patient_id)
         self._attr_icon = "mdi:arrow-up-down"
-        self._calculated_trend = None
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Glucose Trend Arrow"
 
     @property
     def native_value(self):
         """Return the state of the sensor (the arrow character)."""
-        try:
-            if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-                if self._data.measurement and self._data.measurement.value:
-                    # Add measurement to calculator
-                    timestamp = self._data.measurement.timestamp
-                    if hasattr(timestamp, 'isoformat'):
-                        timestamp_str = timestamp.isoformat()
-                    else:
-                        timestamp_str = str(timestamp)
-                    
-                    measurement_data = {
-                        "Timestamp": timestamp_str,
-                        "Value": self._data.measurement.value,
-                        "TrendArrow": self._data.measurement.trend
-                    }
-                    
-                    self.coordinator.trend_calculator.add_measurement(measurement_data)
-                    trend_info = self.coordinator.trend_calculator.calculate_trend()
-                    self._calculated_trend = trend_info
-                    
-                    # Return the arrow character
-                    return trend_info.get("arrow", "→")
-        except Exception as e:
-            _LOGGER.debug("Trend arrow calculation failed: %s", e)
-        
+        trend_info = self._data.trend_info
+        if trend_info is not None:
+            if self._data.measurement and self._data.measurement.value:
+                return trend_info.get("arrow", _ARROW_UNKNOWN)
+
         # Fallback to server trend
         if measurement := self._data.measurement:
             if trend := measurement.trend:
                 # Convert server trend to arrow
                 if isinstance(trend, int):
-                    arrow_map = {
-                        1: "↓",   # Falling fast
-                        2: "↘",   # Falling
-                        3: "→",   # Stable
-                        4: "↗",   # Rising
-                        5: "↑",   # Rising fast
-                    }
-                    return arrow_map.get(trend, "→")
+                    return _ARROW_INT.get(trend, _ARROW_UNKNOWN)
                 elif isinstance(trend, str):
                     # If server provides string trend
-                    trend_map = {
-                        "FALLING_FAST": "↓",
-                        "FALLING": "↘",
-                        "STABLE": "→",
-                        "RISING": "↗",
-                        "RISING_FAST": "↑",
-                    }
-                    return trend_map.get(str(trend).upper(), "→")
+                    return _ARROW_STR.get(trend.upper(), _ARROW_UNKNOWN)
         
-        return "→"  # Default arrow
+        return _ARROW_UNKNOWN  # Default arrow
 
     @property
     def icon(self):
         """Return the icon for the frontend based on enhanced trend calculation."""
         # Use trend calculator data for icon, not the original GLUCOSE_TREND_ICON
-        if self._calculated_trend:
-            trend_category = self._calculated_trend.get("trend", "UNKNOWN").upper()
-            
-            # Map the trend calculator categories to Material Design Icons
-            # This matches what trend_calculator._trend_to_arrow() returns
-            icon_mapping = {
-                "FALLING_FAST": "mdi:arrow-down-bold",      # ↓
-                "FALLING": "mdi:arrow-bottom-right",                # ↘
-                "STABLE": "mdi:arrow-right",                # →
-                "RISING": "mdi:arrow-top-right",                   # ↗
-                "RISING_FAST": "mdi:arrow-up-bold",         # ↑
-                "STALE_DATA": "mdi:clock-alert-outline",    # Clock with alert for stale data
-                "UNKNOWN": "mdi:help-circle-outline",       # Question mark for unknown
-            }
-            
-            return icon_mapping.get(trend_category, "mdi:help-circle-outline")
+        if trend_info := self._data.trend_info:
+            trend_category = trend_info.get("trend", "UNKNOWN").upper()
+            return _TREND_ICON.get(trend_category, _ICON_UNKNOWN)
         
         # Fallback if calculation hasn't run yet
-        return "mdi:help-circle-outline"
+        return _ICON_UNKNOWN
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        attrs = super().extra_state_attributes
-        
-        if self._calculated_trend:
-            attrs.update({
-                "trend_description": self._calculated_trend.get("description", "Unknown"),
-                "trend_category": self._calculated_trend.get("trend", "UNKNOWN"),
-                "trend_rate_mmoll_per_min": round(self._calculated_trend.get("rate", 0.0) * 0.0555, 4),
-            })
+        if trend_info := self._data.trend_info:
+            return {
+                "trend_description": trend_info.get("description", "Unknown"),
+                "trend_category": trend_info.get("trend", "UNKNOWN"),
+                "trend_rate_mmoll_per_min": round(trend_info.get("rate", 0.0) * MMOL_PER_MGDL, 4),
+            }
         
-        return attrs
+        return {}
 
     async def async_update(self):
         """Update the arrow based on latest trend calculation."""
         # This empty method triggers the coordinator to update this sensor
-        # The actual calculation happens in native_value property
+        # The actual calculation happens in the coordinator update
         pass
 
 class MeasurementSensor(LibreLinkSensor):
     """Glucose Measurement Sensor class."""
 
+    __slots__ = ("unit",)
+
+    _attr_name = "Measurement"
+
     def __init__(
         self,
         coordinator: LibreLinkDataUpdateCoordinator,
@@ -616,18 +431,12 @@ class MeasurementSensor(LibreLinkSensor):
         """Initialize the sensor class."""
         super().__init__(coordinator, pid)
         self.unit = unit
-        self._calculated_trend = None  # Add this for enhanced trend
 
     @property
     def state_class(self):
         """Return the state class of the sensor."""
         return SensorStateClass.MEASUREMENT
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Measurement"
-
     @property
     def native_value(self):
         """Return the native value of the sensor."""
@@ -646,47 +455,19 @@ class MeasurementSensor(LibreLinkSensor):
     @property
     def icon(self):
         """Return the icon for the frontend."""
-        # Get trend info from calculator (same as EnhancedTrendSensor)
-        try:
-            if hasattr(self.coordinator, 'trend_calculator') and self.coordinator.trend_calculator:
-                if self._data.measurement and self._data.measurement.value:
-                    # Convert timestamp to string for trend calculator
-                    timestamp = self._data.measurement.timestamp
-                    if hasattr(timestamp, 'isoformat'):
-                        timestamp_str = timestamp.isoformat()
-                    else:
-                        timestamp_str = str(timestamp)
-                    
-                    measurement_data = {
-                        "Timestamp": timestamp_str,
-                        "Value": self._data.measurement.value,
-                        "TrendArrow": self._data.measurement.trend
-                    }
-                    
-                    self.coordinator.trend_calculator.add_measurement(measurement_data)
-                    trend_info = self.coordinator.trend_calculator.calculate_trend()
-                    self._calculated_trend = trend_info
-                    
-                    # Use enhanced trend icon mapping
-                    trend_category = trend_info.get("trend", "UNKNOWN").upper()
-                    icon_mapping = {
-                        "FALLING_FAST": "mdi:arrow-down-bold",
-                        "FALLING": "mdi:arrow-bottom-right",
-                        "STABLE": "mdi:arrow-right",
-                        "RISING": "mdi:arrow-top-right",
-                        "RISING_FAST": "mdi:arrow-up-bold",
-                        "STALE_DATA": "mdi:clock-alert-outline",
-                        "UNKNOWN": "mdi:help-circle-outline",
-                    }
-                    
-                    return icon_mapping.get(trend_category, "mdi:help-circle-outline")
-        except Exception as e:
-            _LOGGER.debug("Enhanced icon calculation failed for MeasurementSensor: %s", e)
-        
+        measurement = self._data.measurement
+        if not measurement:
+            return GLUCOSE_VALUE_ICON
+
+        # Use the trend calculated by the coordinator (same as TrendSensor)
+        trend_info = self._data.trend_info
+        if trend_info is not None and measurement.value:
+            trend_category = trend_info.get("trend", "UNKNOWN").upper()
+            return _TREND_ICON.get(trend_category, _ICON_UNKNOWN)
+
         # Fallback to original trend icon
-        if measurement := self._data.measurement:
-            if trend := measurement.trend:
-                return GLUCOSE_TREND_ICON.get(trend, GLUCOSE_VALUE_ICON)
+        if trend := measurement.trend:
+            return GLUCOSE_TREND_ICON.get(trend, GLUCOSE_VALUE_ICON)
         
         return GLUCOSE_VALUE_ICON
 
@@ -701,10 +482,7 @@ class TimestampSensor(LibreLinkSensor):
 class ApplicationTimestampSensor(TimestampSensor):
     """Sensor Days Sensor class."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Application Timestamp"
+    _attr_name = "Application Timestamp"
 
     @property
     def available(self):
@@ -719,25 +497,22 @@ class ApplicationTimestampSensor(TimestampSensor):
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the librelink sensor."""
-        attrs = super().extra_state_attributes
-        attrs.update({
+        if not self.available:
+            return {
+                "Patient ID": self._data.id,
+                "Patient": self._data.name,
+            }
+        return {
             "Patient ID": self._data.id,
             "Patient": self._data.name,
-        })
-        if self.available:
-            attrs.update({
-                "Serial number": self._data.device.serial_number,
-                "Activation date": self._data.device.application_timestamp,
-            })
-        return attrs
+            "Serial number": self._data.device.serial_number,
+            "Activation date": self._data.device.application_timestamp,
+        }
 
 class ExpirationTimestampSensor(ApplicationTimestampSensor):
     """Sensor Days Sensor class."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Expiration Timestamp"
+    _attr_name = "Expiration Timestamp"
 
     @property
     def native_value(self):
@@ -747,10 +522,7 @@ class ExpirationTimestampSensor(ApplicationTimestampSensor):
 class LastMeasurementTimestampSensor(TimestampSensor):
     """Sensor Delay Sensor class."""
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return "Last Measurement Timestamp"
+    _attr_name = "Last Measurement Timestamp"
 
     @property
     def native_value(self):
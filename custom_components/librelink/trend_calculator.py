@@ -1,14 +1,117 @@
 """Enhanced trend calculation for LibreLink integration."""
 from __future__ import annotations
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+import math
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+from .const import MMOL_PER_MGDL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Trend categories from falling fast to rising fast, and their level
+_TREND_LEVELS = ("FALLING_FAST", "FALLING", "STABLE", "RISING", "RISING_FAST")
+_TREND_LEVEL = {trend: level for level, trend in enumerate(_TREND_LEVELS)}
+
+# Server trend arrows mapped to trend categories
+_ARROW_TO_CAT = {
+    "FORTY_FIVE_DOWN": "FALLING",
+    "SINGLE_DOWN": "FALLING_FAST",
+    "DOUBLE_DOWN": "FALLING_FAST",
+    "FORTY_FIVE_UP": "RISING",
+    "SINGLE_UP": "RISING_FAST",
+    "DOUBLE_UP": "RISING_FAST",
+}
+
+# Trend categories mapped to their arrow and description
+_TREND_TO_ARROW = {
+    "FALLING_FAST": "↓",
+    "FALLING": "↘",
+    "STABLE": "→",
+    "RISING": "↗",
+    "RISING_FAST": "↑",
+}
+_TREND_TO_DESC = {
+    "FALLING_FAST": "Falling fast",
+    "FALLING": "Falling",
+    "STABLE": "Stable",
+    "RISING": "Rising",
+    "RISING_FAST": "Rising fast",
+}
+
+# Rate of change windows, from the most recent: minimum history size,
+# offset of the newest usable measurement from the latest one, window
+# start and end in minutes before the latest measurement, and weight
+_RATE_WINDOWS = (
+    (2, 1, 0.5, 1.5, 3.0),  # 1 minute ± 30 seconds, highest weight
+    (3, 1, 4.0, 6.0, 2.0),  # 5 minutes ± 1 minute, medium weight
+    (4, 2, 14.0, 16.0, 1.0),  # 15 minutes ± 1 minute, never the previous measurement
+)
+
+# Seconds of measurements kept in history
+_HISTORY_WINDOW = 60 * 60
+
+# Weight kept by the previous server trend votes with each new measurement;
+# a new vote weighs 1 - _SMOOTHING_DECAY. With 2/3, two older agreeing
+# arrows outweigh the calculated trend, a single one does not.
+_SMOOTHING_DECAY = 2 / 3
+
+# Upper bounds of each trend level but the last, for bisect_left. The
+# thresholds are defined in mmol/L per minute and converted once to mg/dL
+# per minute, the unit of the calculated rate. Falling trends include
+# their bound, rising trends start at theirs, hence the float just below.
+_TREND_THRESHOLDS_MMOL = (-0.166, -0.055, 0.055, 0.166)
+_TREND_THRESHOLDS_MGDL = (
+    _TREND_THRESHOLDS_MMOL[0] / MMOL_PER_MGDL,
+    _TREND_THRESHOLDS_MMOL[1] / MMOL_PER_MGDL,
+    math.nextafter(_TREND_THRESHOLDS_MMOL[2] / MMOL_PER_MGDL, -math.inf),
+    math.nextafter(_TREND_THRESHOLDS_MMOL[3] / MMOL_PER_MGDL, -math.inf),
+)
+
+# Converts a difference of epoch seconds to minutes
+_MINUTES_PER_SECOND = 1.0 / 60.0
+
+# Minimum seconds between two logged tracebacks of a failing calculation,
+# a persistent error would otherwise be logged on every coordinator update
+_ERROR_LOG_INTERVAL = 600
+
+def _datetime_to_epoch(parsed_time: datetime) -> float:
+    """Return POSIX epoch seconds, naive timestamps are assumed to be UTC."""
+    if parsed_time.tzinfo is None:
+        parsed_time = parsed_time.replace(tzinfo=timezone.utc)
+    return parsed_time.timestamp()
+
+@lru_cache(maxsize=128)
+def _iso_to_epoch(timestamp: str) -> float:
+    """Parse an ISO 8601 timestamp to POSIX epoch seconds.
+
+    Cached for callers passing string timestamps, the coordinator passes
+    epoch seconds and never gets here.
+    """
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return _datetime_to_epoch(datetime.fromisoformat(timestamp))
+
 class TrendCalculator:
     """Calculate glucose trend based on historical measurements."""
 
+    __slots__ = (
+        "max_history",
+        "_epochs",
+        "_values",
+        "_arrows",
+        "_last_added_timestamp",
+        "_last_added_raw",
+        "_cached_trend",
+        "_delta_cache",
+        "_trend_scores",
+        "_last_error_log",
+    )
+
     def __init__(self, max_history: int = 30):
         """Initialize trend calculator.
 
@@ -16,80 +119,123 @@ class TrendCalculator:
             max_history: Maximum number of historical measurements to keep
         """
         self.max_history = max_history
-        self.history: List[Dict[str, Any]] = []
-        self._last_added_timestamp = None  # Track last timestamp to avoid duplicates
-
-    def add_measurement(self, measurement: Dict[str, Any]) -> None:
-        """Add a new glucose measurement to history, skipping duplicates."""
-        # Ensure we have required fields
-        if not all(key in measurement for key in ["Timestamp", "Value", "TrendArrow"]):
-            return
-
-        # Convert timestamp
-        timestamp = measurement["Timestamp"]
-        parsed_time = None
+        # History as parallel, time-ordered ring buffers (one entry per
+        # measurement in each): appends are O(1) and the oldest entry is
+        # evicted automatically once max_history is reached
+        self._epochs: deque[float] = deque(maxlen=max_history)  # POSIX epoch seconds
+        self._values: deque[float] = deque(maxlen=max_history)  # mg/dL
+        self._arrows: deque[Any] = deque(maxlen=max_history)  # Server trend arrows
+        self._last_added_timestamp = None  # Track last timestamp (epoch) to avoid duplicates
+        self._last_added_raw: Any = None  # Same timestamp as passed in, before conversion
+        # (rate, trend) computed from the current history, reset whenever
+        # history changes so repeated calculate_trend calls reuse it
+        self._cached_trend: Optional[tuple[float, str]] = None
+        # Delta results per window in minutes, likewise reset with history
+        self._delta_cache: Dict[int, Dict[str, Any]] = {}
+        # Exponentially weighted votes of the server trend arrows in history
+        # per trend level, used to smooth the calculated trend
+        self._trend_scores = [0.0] * len(_TREND_LEVELS)
+        self._last_error_log = 0.0  # Epoch of the last logged calculation error
+
+    def add_measurement(
+        self, timestamp: float | datetime | str, value: float, trend: Any = None
+    ) -> bool:
+        """Add a new glucose measurement to history, skipping duplicates.
+
+        Args:
+            timestamp: Measurement time, as POSIX epoch seconds, a datetime
+                or an ISO 8601 string
+            value: Glucose value in mg/dL
+            trend: Trend arrow reported by the server
+
+        Returns:
+            True if the measurement was added, False if it was skipped
+        """
+        # The API returns the same reading on every poll until the next
+        # sensor scan, skip it before doing any conversion
+        if timestamp == self._last_added_raw:
+            return False
+
+        # Convert timestamp to POSIX epoch seconds
         try:
-            if isinstance(timestamp, str):
-                # Handle string timestamp
-                if timestamp.endswith("Z"):
-                    timestamp = timestamp[:-1] + "+00:00"
-                parsed_time = datetime.fromisoformat(timestamp)
+            if isinstance(timestamp, (int, float)):
+                epoch = float(timestamp)
+            elif isinstance(timestamp, str):
+                epoch = _iso_to_epoch(timestamp)
             elif isinstance(timestamp, datetime):
-                parsed_time = timestamp
+                epoch = _datetime_to_epoch(timestamp)
             else:
-                return
-
-            # Ensure timezone aware
-            if parsed_time.tzinfo is None:
-                parsed_time = parsed_time.replace(tzinfo=timezone.utc)
+                return False
 
             # Skip if this exact timestamp was just added
-            if self._last_added_timestamp == parsed_time:
+            if self._last_added_timestamp == epoch:
                 _LOGGER.debug(
                     "Skipping duplicate measurement at time %s (value: %s)",
-                    parsed_time, measurement.get("Value")
+                    epoch, value
                 )
-                return
+                return False
 
         except Exception:
             _LOGGER.debug("Error parsing timestamp: %s", timestamp)
-            return
-
-        # Store the parsed time and update last added tracker
-        measurement["_parsed_time"] = parsed_time
-        self._last_added_timestamp = parsed_time
-
-        # Clean old measurements (keep last 60 minutes)
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=60)
-        self.history = [
-            m for m in self.history
-            if m.get("_parsed_time", datetime.min.replace(tzinfo=timezone.utc)) > cutoff
-        ]
-
-        # Add new measurement and maintain sorted order
-        self.history.append(measurement)
-        self.history.sort(key=lambda x: x["_parsed_time"])
-
-        # Trim to max history
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
+            return False
+
+        self._last_added_timestamp = epoch
+        self._last_added_raw = timestamp
+        self._cached_trend = None
+        self._delta_cache.clear()
+
+        # Clean old measurements (keep last 60 minutes). History is kept in
+        # time order, so expired entries are always at the left end.
+        epochs, values, arrows = self._epochs, self._values, self._arrows
+        cutoff = time.time() - _HISTORY_WINDOW
+        if epochs and epochs[0] <= cutoff:
+            while epochs and epochs[0] <= cutoff:
+                epochs.popleft()
+                values.popleft()
+                arrows.popleft()
+            # Votes of expired readings must not outlive them, e.g. after a
+            # gap in the data
+            self._rebuild_trend_scores()
+
+        # Common case: the new measurement is the most recent one
+        if not epochs or epochs[-1] <= epoch:
+            epochs.append(epoch)
+            values.append(value)
+            arrows.append(trend)
+            self._update_trend_scores(trend)
+            return True
+
+        # Out-of-order measurement: insert it at its sorted position. Its
+        # server trend is older than the ones already voted, so it only
+        # votes once the scores are rebuilt from history.
+        pos = bisect_right(epochs, epoch)
+        if len(epochs) == self.max_history:
+            if pos == 0:
+                # Older than everything in a full history, nothing to keep
+                return False
+            epochs.popleft()
+            values.popleft()
+            arrows.popleft()
+            pos -= 1
+        epochs.insert(pos, epoch)
+        values.insert(pos, value)
+        arrows.insert(pos, trend)
+        return True
 
     def calculate_trend(self) -> Dict[str, Any]:
         """Calculate trend based on historical data."""
-        _LOGGER.debug("Calculating trend. History count: %d", len(self.history))
+        history_count = len(self._epochs)
+        _LOGGER.debug("Calculating trend. History count: %d", history_count)
 
         # 1. CHECK FOR STALE DATA (No fresh readings)
-        if not self.history:
+        if not history_count:
             _LOGGER.debug("No historical data available.")
             return self._get_stale_data_result(0)
 
-        latest_measurement = self.history[-1]
-        latest_time = latest_measurement.get("_parsed_time")
-        current_time = datetime.now(latest_time.tzinfo if latest_time.tzinfo else timezone.utc)
-
         # Define what "too old" means (e.g., more than 10 minutes)
         data_timeout_minutes = 10
-        minutes_since_last = (current_time - latest_time).total_seconds() / 60.0
+        now = time.time()
+        minutes_since_last = (now - self._epochs[-1]) * _MINUTES_PER_SECOND
 
         if minutes_since_last > data_timeout_minutes:
             _LOGGER.warning(
@@ -99,23 +245,31 @@ class TrendCalculator:
             return self._get_stale_data_result(minutes_since_last)
 
         # 2. CHECK FOR ENOUGH RECENT DATA
-        if len(self.history) < 2:
+        if history_count < 2:
             _LOGGER.debug("Not enough data for trend calculation (need at least 2 measurements)")
             return self._get_fallback_trend()
 
         try:
-            # Calculate rate of change (mg/dL per minute)
-            rate = self._calculate_rate_of_change(self.history)
-            _LOGGER.debug("Calculated rate: %f mg/dL per min", rate)
+            if self._cached_trend is None:
+                # Calculate rate of change (mg/dL per minute)
+                rate = self._calculate_rate_of_change(self._epochs, self._values)
+
+                # Calculate trend based on rate
+                raw_trend = trend = self._rate_to_trend(rate)
 
-            # Calculate trend based on rate
-            trend = self._rate_to_trend(rate)
-            _LOGGER.debug("Determined trend: %s", trend)
+                # Apply smoothing if we have more history
+                if history_count >= 3:
+                    trend = self._apply_trend_smoothing(trend)
 
-            # Apply smoothing if we have more history
-            if len(self.history) >= 3:
-                trend = self._apply_trend_smoothing(trend)
-                _LOGGER.debug("After smoothing: %s", trend)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Calculated rate: %f mg/dL per min, trend: %s, after smoothing: %s",
+                        rate, raw_trend, trend
+                    )
+
+                self._cached_trend = (rate, trend)
+
+            rate, trend = self._cached_trend
 
             return {
                 "trend": trend,
@@ -123,99 +277,104 @@ class TrendCalculator:
                 "arrow": self._trend_to_arrow(trend),
                 "description": self._trend_to_description(trend),
                 "calculated": True,
-                "history_count": len(self.history),
+                "history_count": history_count,
                 "data_is_fresh": True,
                 "minutes_since_last": minutes_since_last
             }
 
         except Exception as e:
-            _LOGGER.error("Error calculating trend: %s", e, exc_info=True)
+            if now - self._last_error_log >= _ERROR_LOG_INTERVAL:
+                self._last_error_log = now
+                _LOGGER.error("Error calculating trend: %s", e, exc_info=True)
+            else:
+                _LOGGER.debug("Error calculating trend: %s", e)
             return self._get_fallback_trend()
 
-    def _calculate_rate_of_change(self, measurements: List[Dict[str, Any]]) -> float:
-        """Calculate glucose rate of change in mg/dL per minute."""
-        if len(measurements) < 2:
+    def _calculate_rate_of_change(self, epochs: deque[float], values: deque[float]) -> float:
+        """Calculate glucose rate of change in mg/dL per minute.
+
+        Args:
+            epochs: Measurement times as POSIX epoch seconds, which must be
+                in ascending order (add_measurement keeps them sorted, they
+                are not sorted again here)
+            values: Glucose values in mg/dL, parallel to epochs
+        """
+        if len(epochs) < 2:
             _LOGGER.debug("DEBUG: Not enough measurements for rate calculation")
             return 0.0
-        
-        # Sort by time
-        measurements.sort(key=lambda x: x["_parsed_time"])
-        
-        # Calculate multiple rates from different time windows
-        rates = []
-        weights = []
-        latest = measurements[-1]
-
-        # 1-minute rate (most recent)
-        if len(measurements) >= 2:
-            # Find measurement approximately 1 minute ago
-            for i in range(len(measurements)-2, -1, -1):
-                time_diff = (latest["_parsed_time"] - measurements[i]["_parsed_time"]).total_seconds() / 60.0
-                if 0.5 <= time_diff <= 1.5:  # 1 minute ± 30 seconds
-                    rate_1min = (latest["Value"] - measurements[i]["Value"]) / time_diff
-                    rates.append(rate_1min)
-                    weights.append(3.0)  # Highest weight for 1-min rate
-                       
-        # 5-minute rate
-        if len(measurements) >= 3:
-            for i in range(len(measurements)-2, -1, -1):
-                time_diff = (latest["_parsed_time"] - measurements[i]["_parsed_time"]).total_seconds() / 60.0
-                if 4.0 <= time_diff <= 6.0:  # 5 minutes ± 1 minute
-                    rate_5min = (latest["Value"] - measurements[i]["Value"]) / time_diff
-                    rates.append(rate_5min)
-                    weights.append(2.0)  # Medium weight for 5-min rate
- 
-        # 15-minute rate
-        if len(measurements) >= 4:
-            for i in range(len(measurements)-3, -1, -1):
-                time_diff = (latest["_parsed_time"] - measurements[i]["_parsed_time"]).total_seconds() / 60.0
-                if 14.0 <= time_diff <= 16.0:  # 15 minutes ± 1 minute
-                    rate_15min = (latest["Value"] - measurements[i]["Value"]) / time_diff
-                    rates.append(rate_15min)
-                    weights.append(1.0)  # Lower weight for 15-min rate
+
+        # As measurements are in time order, the measurements of each window
+        # are a contiguous run that bisect finds without scanning the rest of
+        # the history. Windows are visited newest first and each run
+        # backwards, which adds the rates up in the same order as a single
+        # backward pass.
+        count = len(epochs)
+        latest_epoch = epochs[-1]
+        latest_value = values[-1]
+        weighted_sum = 0.0
+        total_weight = 0.0
+
+        for min_count, min_offset, first, last, weight in _RATE_WINDOWS:
+            if count < min_count:
+                break
+            # Search with a second of slack, the exact bounds are checked
+            # on the minutes below
+            lo = bisect_left(epochs, latest_epoch - last * 60 - 1)
+            hi = min(bisect_right(epochs, latest_epoch - first * 60 + 1), count - min_offset)
+            for i in range(hi - 1, lo - 1, -1):
+                time_diff = (latest_epoch - epochs[i]) * _MINUTES_PER_SECOND
+                if first <= time_diff <= last:
+                    weighted_sum += (latest_value - values[i]) / time_diff * weight
+                    total_weight += weight
 
         # Calculate weighted average
-        if rates:
-            weighted_sum = sum(r * w for r, w in zip(rates, weights))
-            total_weight = sum(weights)
-            final_rate = weighted_sum / total_weight if total_weight > 0 else 0.0
-            return final_rate
-        
+        if total_weight > 0:
+            return weighted_sum / total_weight
+
         # Fallback: use simple 2-point calculation
-        latest = measurements[-1]
-        previous = measurements[-2]
-        time_diff = (latest["_parsed_time"] - previous["_parsed_time"]).total_seconds() / 60.0
+        time_diff = (latest_epoch - epochs[-2]) * _MINUTES_PER_SECOND
         if time_diff > 0:
-            fallback_rate = (latest["Value"] - previous["Value"]) / time_diff
+            fallback_rate = (latest_value - values[-2]) / time_diff
             return fallback_rate
         
         return 0.0
 
     def _calculate_delta_for_minutes(self, minutes: int) -> Dict[str, Any]:
         """Calculate value delta for a time window, handling missing data."""
-        if len(self.history) < 2:
+        # Deltas only depend on history, reuse them until it changes
+        result = self._delta_cache.get(minutes)
+        if result is None:
+            result = self._delta_cache[minutes] = self._find_delta_for_minutes(minutes)
+        return result
+
+    def _find_delta_for_minutes(self, minutes: int) -> Dict[str, Any]:
+        """Calculate value delta for a time window from history."""
+        epochs, values = self._epochs, self._values
+        if len(epochs) < 2:
             return {"delta_value": 0.0, "time_diff": 0.0, "found": False, "note": "not_enough_data"}
 
-        latest = self.history[-1]
-        target_time = latest["_parsed_time"] - timedelta(minutes=minutes)
+        latest_epoch = epochs[-1]
+        target_time = latest_epoch - minutes * 60
 
         # Set a tolerance (e.g., ± 20% of the window)
-        tolerance_minutes = minutes * 0.2
-        earliest_allowed = target_time - timedelta(minutes=tolerance_minutes)
-        latest_allowed = target_time + timedelta(minutes=tolerance_minutes)
-
-        for measurement in reversed(self.history[:-1]):
-            if earliest_allowed <= measurement["_parsed_time"] <= latest_allowed:
-                # Found a measurement within the acceptable time window
-                delta_value = latest["Value"] - measurement["Value"]
-                actual_time_diff = (latest["_parsed_time"] - measurement["_parsed_time"]).total_seconds() / 60.0
-                return {
-                    "delta_value": delta_value,
-                    "time_diff": actual_time_diff,
-                    "found": True,
-                    "requested_window": minutes,
-                    "actual_window": round(actual_time_diff, 1)
-                }
+        tolerance_seconds = minutes * 0.2 * 60
+        earliest_allowed = target_time - tolerance_seconds
+        latest_allowed = target_time + tolerance_seconds
+
+        # Most recent measurement (before the latest one) not after the end
+        # of the window, history being in time order
+        i = bisect_right(epochs, latest_allowed, 0, len(epochs) - 1) - 1
+        if i >= 0 and epochs[i] >= earliest_allowed:
+            # Found a measurement within the acceptable time window
+            delta_value = values[-1] - values[i]
+            actual_time_diff = (latest_epoch - epochs[i]) * _MINUTES_PER_SECOND
+            return {
+                "delta_value": delta_value,
+                "time_diff": actual_time_diff,
+                "found": True,
+                "requested_window": minutes,
+                "actual_window": round(actual_time_diff, 1)
+            }
 
         # If no measurement found in the acceptable window
         return {
@@ -245,89 +404,56 @@ class TrendCalculator:
             "arrow": "-",
             "description": f"Data outdated ({minutes_since_last:.0f} min)",
             "calculated": False,
-            "history_count": len(self.history),
+            "history_count": len(self._epochs),
             "data_is_fresh": False,
             "minutes_since_last": minutes_since_last
         }
 
     def _rate_to_trend(self, rate: float) -> str:
         """Convert rate of change to trend category."""
-        # rate is in mg/dL per minute
-        
-        # Convert to mmol/L per minute for threshold checking
-        rate_mmol = rate * 0.0555
-        
-        # Use mmol/L thresholds for clarity
-        if rate_mmol <= -0.166:           
-            result = "FALLING_FAST"
-        elif rate_mmol <= -0.055:        
-            result = "FALLING"
-        elif rate_mmol < 0.055:          
-            result = "STABLE"
-        elif rate_mmol < 0.166:           
-            result = "RISING"
-        else:                             
-            result = "RISING_FAST"
-        
-        return result
+        # rate is in mg/dL per minute, like the converted thresholds
+        return _TREND_LEVELS[bisect_left(_TREND_THRESHOLDS_MGDL, rate)]
 
     def _apply_trend_smoothing(self, current_trend: str) -> str:
-        if len(self.history) < 3:
-            return current_trend
-        recent_trends = []
-        for measurement in self.history[-3:]:
-            server_trend = measurement.get("TrendArrow", "")
-            if server_trend:
-                server_trend_cat = self._arrow_to_trend_category(server_trend)
-                if server_trend_cat:
-                    recent_trends.append(server_trend_cat)
-        if not recent_trends:
+        if len(self._arrows) < 3:
             return current_trend
-        trend_counts = {}
-        for trend in recent_trends + [current_trend]:
-            trend_counts[trend] = trend_counts.get(trend, 0) + 1
-        most_common = max(trend_counts.items(), key=lambda x: x[1])
-        if most_common[0] != current_trend and most_common[1] >= 2:
-            trend_levels = ["FALLING_FAST", "FALLING", "STABLE", "RISING", "RISING_FAST"]
-            current_idx = trend_levels.index(current_trend) if current_trend in trend_levels else -1
-            common_idx = trend_levels.index(most_common[0]) if most_common[0] in trend_levels else -1
-            if abs(current_idx - common_idx) <= 1:
-                return most_common[0]
+        # Work on trend levels (indexes into _TREND_LEVELS) so neighbouring
+        # trends are one apart. The calculated trend votes like the newest
+        # server trend, and wins ties.
+        scores = self._trend_scores
+        current_level = _TREND_LEVEL[current_trend]
+        most_common = max(range(len(scores)), key=scores.__getitem__)
+        if (
+            most_common != current_level
+            and scores[most_common] > scores[current_level] + (1.0 - _SMOOTHING_DECAY)
+            and abs(current_level - most_common) <= 1
+        ):
+            return _TREND_LEVELS[most_common]
         return current_trend
 
-    def _arrow_to_trend_category(self, arrow: str) -> Optional[str]:
-        arrow_map = {
-            "FORTY_FIVE_DOWN": "FALLING",
-            "SINGLE_DOWN": "FALLING_FAST",
-            "DOUBLE_DOWN": "FALLING_FAST",
-            "FORTY_FIVE_UP": "RISING",
-            "SINGLE_UP": "RISING_FAST",
-            "DOUBLE_UP": "RISING_FAST",
-        }
-        return arrow_map.get(arrow, None)
+    def _update_trend_scores(self, arrow: Any) -> None:
+        """Decay the server trend votes and add the vote of the newest arrow."""
+        scores = self._trend_scores
+        for level in range(len(scores)):
+            scores[level] *= _SMOOTHING_DECAY
+        server_trend_cat = _ARROW_TO_CAT.get(arrow)
+        if server_trend_cat:
+            scores[_TREND_LEVEL[server_trend_cat]] += 1.0 - _SMOOTHING_DECAY
+
+    def _rebuild_trend_scores(self) -> None:
+        """Recalculate the server trend votes from the arrows in history."""
+        self._trend_scores = [0.0] * len(_TREND_LEVELS)
+        for arrow in self._arrows:
+            self._update_trend_scores(arrow)
 
     def _trend_to_arrow(self, trend: str) -> str:
-        arrow_map = {
-            "FALLING_FAST": "↓",
-            "FALLING": "↘",
-            "STABLE": "→",
-            "RISING": "↗",
-            "RISING_FAST": "↑",
-        }
-        return arrow_map.get(trend, "→")
+        return _TREND_TO_ARROW.get(trend, "→")
 
     def _trend_to_description(self, trend: str) -> str:
-        desc_map = {
-            "FALLING_FAST": "Falling fast",
-            "FALLING": "Falling",
-            "STABLE": "Stable",
-            "RISING": "Rising",
-            "RISING_FAST": "Rising fast",
-        }
-        return desc_map.get(trend, "Stable")
+        return _TREND_TO_DESC.get(trend, "Stable")
 
     def _get_fallback_trend(self) -> Dict[str, Any]:
-        if not self.history:
+        if not self._epochs:
             return {
                 "trend": "STABLE",
                 "rate": 0.0,
@@ -338,27 +464,24 @@ class TrendCalculator:
                 "data_is_fresh": False,
                 "minutes_since_last": 999
             }
-        latest = self.history[-1]
-        server_trend = latest.get("TrendArrow", "")
-        trend_cat = self._arrow_to_trend_category(server_trend) or "STABLE"
+        server_trend = self._arrows[-1]
+        trend_cat = _ARROW_TO_CAT.get(server_trend) or "STABLE"
         return {
             "trend": trend_cat,
             "rate": 0.0,
-            "arrow": self._trend_to_arrow(trend_cat),
-            "description": self._trend_to_description(trend_cat),
+            "arrow": _TREND_TO_ARROW[trend_cat],
+            "description": _TREND_TO_DESC[trend_cat],
             "calculated": False,
-            "history_count": len(self.history),
+            "history_count": len(self._epochs),
             "data_is_fresh": True,
             "minutes_since_last": 0
         }
 
     def clear_history(self) -> None:
-        self.history.clear()
-        _LOGGER.debug("Cleared trend calculation history")
-
-    def _calculate_rate_between(self, earlier: Dict[str, Any], later: Dict[str, Any]) -> float:
-        time_diff_min = (later["_parsed_time"] - earlier["_parsed_time"]).total_seconds() / 60.0
-        if time_diff_min <= 0:
-            return 0.0
-        value_diff = later["Value"] - earlier["Value"]
-        return value_diff / time_diff_min
\ No newline at end of file
+        self._epochs.clear()
+        self._values.clear()
+        self._arrows.clear()
+        self._cached_trend = None
+        self._delta_cache.clear()
+        self._rebuild_trend_scores()
+        _LOGGER.debug("Cleared trend calculation history")
\ No newline at end of file